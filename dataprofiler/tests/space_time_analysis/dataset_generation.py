@@ -37,18 +37,16 @@ def nan_injection(
     :type rng: numpy Generator
     :param df: DataFrame that is to be injected with NAN values
     :type df: pandas.DataFrame
-    :param df: DataFrame that is to be injected with NAN values
-    :type df: pandas.DataFrame
     :param percent_to_nan: Percentage of dataset that needs to be nan values
     :type percent_to_nan: float, optional
 
     :return: New DataFrame with injected NAN values
     """
     samples_to_nan = int(len(df) * percent_to_nan / 100)
-    for col_name in df:
-        ind_to_nan = rng.choice(list(df.index), samples_to_nan)
-        df[col_name][ind_to_nan] = "None"
-    return df
+    # each column of the argsort is a random permutation of the row positions,
+    # so exactly samples_to_nan rows are selected in every column
+    mask = rng.random(df.shape).argsort(axis=0) < samples_to_nan
+    return df.mask(mask, "None")
 
 
 def convert_data_to_df(
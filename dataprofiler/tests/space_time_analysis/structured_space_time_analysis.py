@@ -1,10 +1,17 @@
 """Contains space and time analysis tests for the Dataprofiler"""
+import argparse
+import array
+import contextlib
+import copy
+import functools
 import json
+import multiprocessing
 import os
 import random
+import tempfile
 import time
-from collections import defaultdict
-from typing import Dict, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, MutableSequence, Optional, Tuple, Union
 
 import memray
 import numpy as np
@@ -12,6 +19,11 @@ import pandas as pd
 import tensorflow as tf
 from numpy.random import Generator
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 try:
     import sys
 
@@ -23,15 +35,114 @@ except ImportError:
 from dataset_generation import NumpyEncoder, generate_dataset_by_class, nan_injection
 
 from dataprofiler import StructuredProfiler
+from dataprofiler.data_readers.base_data import BaseData
 
 # suppress TF warnings
 tf.compat.v1.logging.set_verbosity(tf.compat.v1.logging.ERROR)
 
+# columns of the flat rows collected for each profiled function time
+TIME_COLUMNS = ["name", "sample_size", "compiler", "inspector", "function", "time"]
+
+# columns of the settings and times shared by every row of a sample size
+RUN_META_COLUMNS = [
+    "sample_size",
+    "total_time",
+    "merge",
+    "percent_to_nan",
+    "allow_subsampling",
+    "is_data_labeler",
+    "is_multiprocessing",
+    "max_workers",
+]
+
+# rss sampling interval of the memray trackers. 10x coarser than memray's
+# default of 10ms to lower tracking overhead, at the cost of a coarser memory
+# over time graph in the memray reports
+MEMORY_INTERVAL_MS = 100
+
+# options of the current process, set once by _init_process. Tasks share this
+# object rather than each unpickling their own copy, so anything the warm-up
+# stores on the options (e.g. the data labeler) is seen by every sample size.
+_process_options = None
+
+
+def _extend_times(
+    profile_times: Dict[str, MutableSequence],
+    name: str,
+    sample_size: int,
+    compiler_name: Optional[str],
+    inspector_name: Optional[str],
+    times: Dict[str, float],
+) -> None:
+    """
+    Append the times of a single inspector to the flat time columns
+
+    :param profile_times: columns of the time rows, keyed by TIME_COLUMNS
+    :type profile_times: Dict[str, MutableSequence]
+    :param name: name of the profiled column
+    :type name: str
+    :param sample_size: number of rows sampled from the dataset
+    :type sample_size: int
+    :param compiler_name: name of the compiler, None for the top-level profiler
+    :type compiler_name: str, None
+    :param inspector_name: name of the inspector, None for the top-level profiler
+    :type inspector_name: str, None
+    :param times: time taken by each profiled function
+    :type times: Dict[str, float]
+    """
+    num_times = len(times)
+    profile_times["name"].extend([name] * num_times)
+    profile_times["sample_size"].extend([sample_size] * num_times)
+    profile_times["compiler"].extend([compiler_name] * num_times)
+    profile_times["inspector"].extend([inspector_name] * num_times)
+    profile_times["function"].extend(times.keys())
+    profile_times["time"].extend(times.values())
+
+
+def _json_dumps(obj, indent: bool = False) -> bytes:
+    """
+    Serialize an object to json, using orjson when it is installed
+
+    :param obj: object to be serialized
+    :type obj: Any
+    :param indent: whether to indent the output for readability
+    :type indent: bool, optional
+
+    :return: the serialized json
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, cls=NumpyEncoder).encode()
+
+
+def _copy_profile(profile: StructuredProfiler) -> StructuredProfiler:
+    """
+    Deep copy a profile to be merged with the original
+
+    Merging a profile with itself shares every inspector between both sides,
+    so the copy gives the merge cost of two separate profiles. The data labeler
+    is shared rather than copied as merging requires both labelers be equal.
+
+    :param profile: Profile that is to be copied
+    :type profile: StructuredProfile
+
+    :return: copy of the profile
+    """
+    memo = {}
+    data_labeler = profile.options.data_labeler.data_labeler_object
+    if data_labeler is not None:
+        memo[id(data_labeler)] = data_labeler
+    return copy.deepcopy(profile, memo)
+
 
 def dp_profile_space_analysis(
     data: pd.DataFrame,
     path: str,
     options: Optional[Dict] = None,
+    native_traces: bool = False,
 ) -> StructuredProfiler:
     """
     Generate memray bin file of the space analysis of dp.Profiler function
@@ -42,39 +153,253 @@ def dp_profile_space_analysis(
     :type path: string
     :param options: options for the dataprofiler intialization
     :type options: Dict, None, optional
+    :param native_traces: whether to also capture the native stack of each
+        allocation, e.g. for tensorflow allocations within the data labeler
+    :type native_traces: bool, optional
 
     :return: The StructuredProfile generated by dp.Profiler
     """
-    with memray.Tracker(path):
+    with memray.Tracker(
+        path, native_traces=native_traces, memory_interval_ms=MEMORY_INTERVAL_MS
+    ):
         profile = dp.Profiler(data, options=options, samples_per_update=len(data))
 
     return profile
 
 
-def dp_merge_space_analysis(profile: StructuredProfiler, path: str):
+def dp_merge_space_analysis(
+    profile: StructuredProfiler, path: str, native_traces: bool = False
+):
     """
     Generate memray bin file of the space analysis of merge profile functionality
 
-    :param profile: Profile that is to be merged with itself
+    :param profile: Profile that is to be merged with a copy of itself
     :type profile: StructuredProfile
     :param path: Path to output the memray bin file generated for space analysis
     :type path: string
+    :param native_traces: whether to also capture the native stack of each
+        allocation
+    :type native_traces: bool, optional
+    """
+
+    other_profile = _copy_profile(profile)
+    with memray.Tracker(
+        path, native_traces=native_traces, memory_interval_ms=MEMORY_INTERVAL_MS
+    ):
+        _ = profile + other_profile
+
+
+def _warm_up(data_path: str, options: Optional[Dict]) -> None:
+    """
+    Profile an empty sample before any sample size is timed
+
+    The profiler loads the data labeler when enabled and stores it on the
+    options, so every later profile using the same options reuses the model.
+    A failed load warns and disables the data labeler, as within the profiler.
+
+    :param data_path: Path to the pickled dict of column arrays to be sampled
+    :type data_path: string
+    :param options: options for the dataprofiler intialization
+    :type options: Dict, None
+    """
+    columns = pd.read_pickle(data_path)
+    _ = dp.Profiler(
+        pd.DataFrame({name: column[:0] for name, column in columns.items()}),
+        options=options,
+    )
+    print("Warm-up done")
+
+
+def _init_process(data_path: str, options: Optional[Dict]) -> None:
+    """
+    Store the options for the current process and warm up the profiler
+
+    :param data_path: Path to the pickled dict of column arrays to be sampled
+    :type data_path: string
+    :param options: options for the dataprofiler intialization
+    :type options: Dict, None
+    """
+    global _process_options
+
+    _process_options = options
+    _warm_up(data_path, _process_options)
+
+
+def _run_sample_size(
+    sample_size: int,
+    seed: int,
+    data_path: str,
+    path: str,
+    percent_to_nan: float,
+    allow_subsampling: bool,
+    space_analysis: bool,
+    time_analysis: bool,
+    native_traces: bool,
+) -> Tuple[Dict, Dict[str, MutableSequence]]:
+    """
+    Run the space and time analysis for a single sample size of the dataset
+
+    :param sample_size: number of rows to sample from the dataset
+    :type sample_size: int
+    :param seed: seed used for sampling, nan injection and the profiler
+    :type seed: int
+    :param data_path: Path to the pickled dict of column arrays to be sampled
+    :type data_path: string
+    :param path: Path to output json file with all time analysis info
+    :type path: string
+    :param percent_to_nan: Percentage of dataset that needs to be nan values
+    :type percent_to_nan: float
+    :param allow_subsampling: boolean to allow subsampling when running analysis
+    :type allow_subsampling: bool
+    :param space_analysis: boolean to turn on or off the space analysis functionality
+    :type space_analysis: bool
+    :param time_analysis: boolean to turn on or off the time analysis functionality
+    :type time_analysis: bool
+    :param native_traces: whether the space analysis captures native stacks
+    :type native_traces: bool
+
+    :return: total and merge time and the options flags of the sample size,
+        and the time columns of each profiled function in the columns and the
+        top-level profiler
     """
+    rng = np.random.default_rng(seed)
+    # spawned workers do not inherit the seed set in the parent process
+    dp.set_seed(int(seed))
+    options = _process_options
+    columns = pd.read_pickle(data_path)
+    num_rows = len(next(iter(columns.values()), []))
+    # read after the warm-up, which disables the data labeler if it fails to load
+    sample_times = {
+        "sample_size": sample_size,
+        "is_data_labeler": options.structured_options.data_labeler.is_enabled,
+        "is_multiprocessing": options.structured_options.multiprocess.is_enabled,
+    }
+    # parallel columns rather than a tuple per row, with the times kept in a
+    # contiguous float buffer
+    profile_times: Dict[str, MutableSequence] = {column: [] for column in TIME_COLUMNS}
+    profile_times["sample_size"] = array.array("q")
+    profile_times["time"] = array.array("d")
+
+    print(f"Evaluating sample size: {sample_size}")
+    replace = False
+    if sample_size > num_rows:
+        replace = True
+
+    # sorting positional indices keeps the original row order without
+    # sorting the sampled frame's index
+    sample_idx = np.sort(rng.choice(num_rows, size=sample_size, replace=replace))
+    sample_data = pd.DataFrame(
+        {name: column[sample_idx] for name, column in columns.items()}, copy=False
+    )
+
+    if percent_to_nan:
+        sample_data = nan_injection(rng, sample_data, percent_to_nan)
+    if time_analysis:
+        # time profiling with a monotonic, nanosecond resolution counter
+        start_time = time.perf_counter_ns()
+        if allow_subsampling:
+            profiler = dp.Profiler(sample_data, options=options)
+        else:
+            print(f"Length of dataset {len(sample_data)}")
+            profiler = dp.Profiler(
+                sample_data, samples_per_update=len(sample_data), options=options
+            )
+        total_time_ns = time.perf_counter_ns() - start_time
+
+        # get overall time for merging profiles, copied outside of the timing
+        other_profiler = _copy_profile(profiler)
+        start_time = time.perf_counter_ns()
+        try:
+            merged_profile = profiler + other_profiler
+        except ValueError:
+            pass  # empty profile merge if 0 data
+        merge_time_ns = time.perf_counter_ns() - start_time
+
+        # kept as integer nanoseconds, converted to seconds when reported
+        sample_times["total_time_ns"] = total_time_ns
+        sample_times["merge_time_ns"] = merge_time_ns
+
+        # get times for each profile in the columns
+        for profile in profiler.profile:
+            for compiler_name, compiler in profile.profiles.items():
+                for inspector_name, inspector in compiler._profiles.items():
+                    _extend_times(
+                        profile_times,
+                        profile.name,
+                        sample_size,
+                        compiler_name,
+                        inspector_name,
+                        inspector.times,
+                    )
+
+        # add time for for Top-level
+        _extend_times(
+            profile_times,
+            "StructuredProfiler",
+            sample_size,
+            None,
+            None,
+            profiler.times,
+        )
+        time_report_path = os.path.join(
+            os.path.dirname(path), f"time_report_{sample_size}.txt"
+        )
+        # workers may race to create the directory
+        os.makedirs(os.path.dirname(time_report_path), exist_ok=True)
+
+        with open(time_report_path, "a") as f:
+            f.write(f"COMPLETE sample size: {sample_size} \n")
+            print(f"COMPLETE sample size: {sample_size}")
+            f.write(f"Profiled in {total_time_ns / 1e9} seconds \n")
+            print(f"Profiled in {total_time_ns / 1e9} seconds")
+            f.write(f"Merge in {merge_time_ns / 1e9} seconds \n")
+            print(f"Merge in {merge_time_ns / 1e9} seconds")
+            print()
+            f.close()
+
+    if space_analysis:
+        os.makedirs("./space_analysis/", exist_ok=True)
+        profile = dp_profile_space_analysis(
+            data=sample_data,
+            path=f"./space_analysis/profile_space_analysis_{sample_size}.bin",
+            options=options,
+            native_traces=native_traces,
+        )
+        print(
+            f"Profile Space Analysis results saved to "
+            f"./space_analysis/profile_space_analysis_{sample_size}.bin"
+        )
+        try:
+            dp_merge_space_analysis(
+                profile=profile,
+                path=f"./space_analysis/merge_space_analysis_{sample_size}.bin",
+                native_traces=native_traces,
+            )
+            print(
+                f"Profile Space Analysis results saved to "
+                f"./space_analysis/profile_space_analysis_{sample_size}.bin"
+            )
+        except ValueError:
+            # empty profile merge if 0 data
+            print(f"Warning: Profile merge failure on dataset set size {sample_size}")
+            os.remove(f"./space_analysis/profile_space_analysis_{sample_size}.bin")
 
-    with memray.Tracker(path):
-        _ = profile + profile
+    return sample_times, profile_times
 
 
 def dp_space_time_analysis(
     rng: Generator,
     sample_sizes: List,
-    data: pd.DataFrame,
+    data: Union[pd.DataFrame, BaseData],
     path: str = "./time_analysis/structured_profiler_times.json",
     percent_to_nan: float = 0.0,
     allow_subsampling: bool = True,
     options: Optional[Dict] = None,
     space_analysis=True,
     time_analysis=True,
+    max_workers: Optional[int] = 1,
+    native_traces: bool = False,
+    pretty: bool = False,
 ):
     """
     Run time analysis for profile and merge functionality
@@ -83,8 +408,8 @@ def dp_space_time_analysis(
     :type rng: numpy Generator
     :param sample_sizes: List of sample sizes of dataset to be analyzed
     :type sample_sizes: list
-    :param data: DataFrame to be used for time analysis
-    :type data: pandas DataFrame
+    :param data: DataFrame or dp.Data to be used for time analysis
+    :type data: pandas DataFrame, BaseData
     :param path: Path to output json file with all time analysis info
     :type path: string, optional
     :param percent_to_nan: Percentage of dataset that needs to be nan values
@@ -93,154 +418,132 @@ def dp_space_time_analysis(
     :type allow_subsampling: bool, optional
     :param options: options for the dataprofiler intialization
     :type options: Dict, None, optional
-    :param options: options for the dataprofiler intialization
-    :type options: Dict, None, optional
     :param space_analysis: boolean to turn on or off the space analysis functionality
     :type space_analysis: bool, optional
     :param time_analysis: boolean to turn on or off the time analysis functionality
     :type time_analysis: bool, optional
+    :param max_workers: number of processes evaluating sample sizes concurrently,
+        defaults to 1 so timings are not measured under contention. None is one
+        per sample size up to the cpu count. Ignored when the profiler's
+        multiprocessing is enabled.
+    :type max_workers: int, None, optional
+    :param native_traces: whether the space analysis captures the native stack
+        of each allocation, which adds overhead to every allocation
+    :type native_traces: bool, optional
+    :param pretty: whether to indent the output json for readability
+    :type pretty: bool, optional
     """
-    # [0] allows model to be initialized and added to labeler
-    sample_sizes = [0] + sample_sizes
-    profile_times = []
-    for sample_size in sample_sizes:
-        # setup time dict
-
-        print(f"Evaluating sample size: {sample_size}")
-        replace = False
-        if sample_size > len(data):
-            replace = True
-
-        sample_data = (
-            data.sample(sample_size, replace=replace)
-            .sort_index()
-            .reset_index(drop=True)
+    # each sample size gets its own seed so the results do not depend on the
+    # order in which the workers run
+    seeds = rng.integers(np.iinfo(np.int32).max, size=len(sample_sizes))
+    if max_workers is None:
+        max_workers = min(len(sample_sizes), os.cpu_count() or 1)
+    # avoid nesting the profiler's own pool inside the worker pool
+    if options.structured_options.multiprocess.is_enabled:
+        max_workers = 1
+
+    base_path = os.path.splitext(path)[0]
+    # settings and times shared by every row of a sample size are stored once
+    # here and joined back onto the rows when the times table is built
+    run_meta: Dict[str, List] = {column: [] for column in RUN_META_COLUMNS}
+    with contextlib.ExitStack() as stack:
+        # workers load the dataset from disk rather than having it pickled
+        # through the pool for every sample size. Pickle is used over parquet
+        # as generated datasets have non-string column names. Storing the
+        # columns as arrays lets each sample be built without pandas' take.
+        tmp_dir = stack.enter_context(tempfile.TemporaryDirectory())
+        data_path = os.path.join(tmp_dir, "data.pkl")
+        # dp.Data readers forward attributes to their frame but can't be indexed
+        frame = data.data if isinstance(data, BaseData) else data
+        pd.to_pickle(
+            {name: frame[name].to_numpy(copy=False) for name in frame.columns},
+            data_path,
         )
 
-        if percent_to_nan:
-            sample_data = nan_injection(rng, sample_data)
-        if time_analysis:
-            # time profiling
-            start_time = time.time()
-            if allow_subsampling:
-                profiler = dp.Profiler(sample_data, options=options)
-            else:
-                print(f"Length of dataset {len(sample_data)}")
-                profiler = dp.Profiler(
-                    sample_data, samples_per_update=len(sample_data), options=options
+        run_sample_size = functools.partial(
+            _run_sample_size,
+            data_path=data_path,
+            path=path,
+            percent_to_nan=percent_to_nan,
+            allow_subsampling=allow_subsampling,
+            space_analysis=space_analysis,
+            time_analysis=time_analysis,
+            native_traces=native_traces,
+        )
+        # each process warms up on the same options object its sample sizes
+        # use, so tensorflow start-up and the data labeler load both happen
+        # before any sample size is timed
+        if max_workers > 1:
+            # spawn as tensorflow is not fork-safe
+            executor = stack.enter_context(
+                ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_process,
+                    initargs=(data_path, options),
                 )
-            total_time = time.time() - start_time
-
-            # get overall time for merging profiles
-            start_time = time.time()
-            try:
-                merged_profile = profiler + profiler
-            except ValueError:
-                pass  # empty profile merge if 0 data
-            merge_time = time.time() - start_time
-
-            # get times for each profile in the columns
-            for profile in profiler.profile:
-                compiler_times = defaultdict(list)
-
-                for compiler_name in profile.profiles:
-                    compiler = profile.profiles[compiler_name]
-                    inspector_times = dict()
-                    for inspector_name in compiler._profiles:
-                        inspector = compiler._profiles[inspector_name]
-                        inspector_times[inspector_name] = inspector.times
-                    compiler_times[compiler_name] = inspector_times
-                column_profile_time = {
-                    "name": profile.name,
-                    "sample_size": sample_size,
-                    "total_time": total_time,
-                    "column": compiler_times,
-                    "merge": merge_time,
-                    "percent_to_nan": percent_to_nan,
-                    "allow_subsampling": allow_subsampling,
-                    "is_data_labeler": options.structured_options.data_labeler.is_enabled,
-                    "is_multiprocessing": options.structured_options.multiprocess.is_enabled,
-                }
-                profile_times += [column_profile_time]
-
-            # add time for for Top-level
-            if sample_size:
-                profile_times += [
-                    {
-                        "name": "StructuredProfiler",
-                        "sample_size": sample_size,
-                        "total_time": total_time,
-                        "column": profiler.times,
-                        "merge": merge_time,
-                        "percent_to_nan": percent_to_nan,
-                        "allow_subsampling": allow_subsampling,
-                        "is_data_labeler": options.structured_options.data_labeler.is_enabled,
-                        "is_multiprocessing": options.structured_options.multiprocess.is_enabled,
-                    }
-                ]
-            time_report_path = os.path.join(
-                os.path.dirname(path), f"time_report_{sample_size}.txt"
             )
-            if not os.path.exists(os.path.dirname(time_report_path)):
-                os.makedirs(os.path.dirname(time_report_path))
-
-            with open(time_report_path, "a") as f:
-                f.write(f"COMPLETE sample size: {sample_size} \n")
-                print(f"COMPLETE sample size: {sample_size}")
-                f.write(f"Profiled in {total_time} seconds \n")
-                print(f"Profiled in {total_time} seconds")
-                f.write(f"Merge in {merge_time} seconds \n")
-                print(f"Merge in {merge_time} seconds")
-                print()
-                f.close()
-
-        if space_analysis:
-            if not os.path.exists("./space_analysis/"):
-                os.makedirs("./space_analysis/")
-            profile = dp_profile_space_analysis(
-                data=sample_data,
-                path=f"./space_analysis/profile_space_analysis_{sample_size}.bin",
-                options=options,
-            )
-            print(
-                f"Profile Space Analysis results saved to "
-                f"./space_analysis/profile_space_analysis_{sample_size}.bin"
-            )
-            try:
-                dp_merge_space_analysis(
-                    profile=profile,
-                    path=f"./space_analysis/merge_space_analysis_{sample_size}.bin",
-                )
-                print(
-                    f"Profile Space Analysis results saved to "
-                    f"./space_analysis/profile_space_analysis_{sample_size}.bin"
-                )
-            except ValueError:
-                # empty profile merge if 0 data
-                print(
-                    f"Warning: Profile merge failure on dataset set size {sample_size}"
-                )
-                os.remove(f"./space_analysis/profile_space_analysis_{sample_size}.bin")
+            results = executor.map(run_sample_size, sample_sizes, seeds)
+        else:
+            _init_process(data_path, options)
+            results = map(run_sample_size, sample_sizes, seeds)
 
-    # Print dictionary with profile times
-    print("Results Saved")
-    # print(json.dumps(profile_times, indent=4))
+        if time_analysis:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # rows are streamed to disk as each sample size is consumed rather
+            # than accumulated for the whole run. Serially only one sample
+            # size's rows are held at a time; in parallel, finished results
+            # wait in their futures until the loop reaches them.
+            fp = stack.enter_context(open(base_path + ".jsonl", "wb"))
+
+        for sample_times, sample_profile_times in results:
+            if not time_analysis:
+                continue
+            run_meta["sample_size"].append(sample_times["sample_size"])
+            run_meta["total_time"].append(sample_times["total_time_ns"] / 1e9)
+            run_meta["merge"].append(sample_times["merge_time_ns"] / 1e9)
+            run_meta["percent_to_nan"].append(percent_to_nan)
+            run_meta["allow_subsampling"].append(allow_subsampling)
+            run_meta["is_data_labeler"].append(sample_times["is_data_labeler"])
+            run_meta["is_multiprocessing"].append(sample_times["is_multiprocessing"])
+            run_meta["max_workers"].append(max_workers)
+            for row in zip(*(sample_profile_times[c] for c in TIME_COLUMNS)):
+                fp.write(_json_dumps(dict(zip(TIME_COLUMNS, row))) + b"\n")
 
-    # only works if columns all have unique names
-    times_table = (
-        pd.json_normalize(profile_times).set_index(["name", "sample_size"]).sort_index()
-    )
+    print("Results Saved")
 
     # save json and times table
     if time_analysis:
-        if not os.path.exists(os.path.dirname(path)):
-            os.makedirs(os.path.dirname(path))
-        with open(path, "w") as fp:
-            json.dump(profile_times, fp, indent=4, cls=NumpyEncoder)
-        times_table.to_csv(path)
+        with open(path, "wb") as fp:
+            fp.write(_json_dumps({"run_meta": run_meta}, indent=pretty))
+
+        # only works if columns all have unique names
+        times_table = (
+            pd.read_json(
+                base_path + ".jsonl",
+                lines=True,
+                convert_dates=False,
+                precise_float=True,
+            )
+            .astype({"name": str})
+            .merge(pd.DataFrame(run_meta, columns=RUN_META_COLUMNS), on="sample_size")
+            .set_index(TIME_COLUMNS[:-1])
+            .sort_index()
+        )
+        times_table.to_parquet(
+            base_path + ".parquet", engine="pyarrow", compression="zstd"
+        )
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="indent the output json for readability, compact by default",
+    )
+    args = parser.parse_args()
+
     ################################################################################
     ######################## set any optional changes here #########################
     ################################################################################
@@ -259,7 +562,12 @@ if __name__ == "__main__":
 
     TIME_ANALYSIS = True
     SPACE_ANALYSIS = True
+    NATIVE_TRACES = False  # capture C stacks of allocations in space analysis
     SAMPLE_SIZES = [100, 1000, 5000, 7500, int(1e5)]
+    # number of sample sizes evaluated concurrently, None is one per cpu.
+    # Parallel runs compete for cores, so their times are not comparable to
+    # serial runs.
+    MAX_WORKERS = 1
 
     # set seed
     RANDOM_SEED = 0
@@ -291,4 +599,7 @@ if __name__ == "__main__":
         allow_subsampling=ALLOW_SUBSAMPLING,
         time_analysis=TIME_ANALYSIS,
         space_analysis=SPACE_ANALYSIS,
+        max_workers=MAX_WORKERS,
+        native_traces=NATIVE_TRACES,
+        pretty=args.pretty,
     )